@@ -6,8 +6,56 @@ import warnings
 import hdf5plugin
 import re
 import dask.array as da
+import zarr
+from dask import delayed
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 import warnings
 
+# raw data chunk cache of the persistent file handle; large enough to hold a whole
+# chunk of a 3D volume so that tile stitching does not re-read/decompress chunks
+_RDCC_NBYTES = 64 * 1024 * 1024
+_RDCC_NSLOTS = 100003
+# chunk size targeted by copy(chunks='auto'); matches HDF5's default 1 MB chunk cache
+_CHUNK_TARGET_BYTES = 1024 * 1024
+# keys accepted by __getitem__: a single image, or several images stacked along the first axis
+IndexKey = int | slice | Sequence[int] | np.ndarray
+# tile datasets of the deprecated tile format
+_TILE_RE = re.compile(r'^TILE_\d+$')
+
+def _attr_value(attrs, attr_name, default=None):
+    '''
+    Return a TCF attribute as a python scalar. TCF stores attributes as single-element arrays.
+    attrs is either an h5py AttributeManager or a dict snapshot of one.
+    '''
+    attr_value = attrs.get(attr_name)
+    if attr_value is None:
+        return default
+    attr_value = attr_value[0]
+    return attr_value.item() if isinstance(attr_value, np.generic) else attr_value
+
+def _parse_version(version):
+    '''
+    Return (major, minor) of a FormatVersion as ints, so that '1.10' > '1.3'.
+    Only the leading digits of each part count ('1.4b' -> (1, 4)).
+    '''
+    return tuple(int(re.match(r'\d*', part)[0] or 0) for part in version.split('.')[:2])
+
+def _auto_chunk(shape, dtype, target_bytes=_CHUNK_TARGET_BYTES):
+    '''
+    Return a chunk shape of about target_bytes that keeps the trailing axes whole,
+    so that a chunk is a slab of full (Y, X) planes along Z.
+    If a single plane is larger than target_bytes, it is split along Y instead.
+    '''
+    chunks = list(shape)
+    itemsize = np.dtype(dtype).itemsize
+    for axis in range(len(chunks)):
+        inner_bytes = max(1, itemsize * int(np.prod(chunks[axis+1:])))
+        chunks[axis] = max(1, min(shape[axis], target_bytes // inner_bytes))
+        if inner_bytes <= target_bytes:
+            break
+    return tuple(chunks)
+
 def TCFile(tcfname:str, imgtype, channel=0):
     warnings.warn(
         "TCFile function is deprecated and will be removed by the end of 2026. "
@@ -27,7 +75,128 @@ def TCFile(tcfname:str, imgtype, channel=0):
         return TCFileFL3D(tcfname, channel)
     raise ValueError('Unsupported imgtype: Supported imgtypes are "3D", "2DMIP", "BF", and "3DFL"')
 
-class TCFileAbstract(Sequence):
+class TCFileSequenceMixin(Sequence):
+    '''
+    backend-independent part of the TCFile readers: length, key handling, stacking and iteration.
+    Subclasses set `length` and `data_shape`, and implement `__getitem__` and `dtype`.
+    '''
+    # number of frames read ahead while iterating
+    prefetch = 4
+
+    def __len__(self):
+        '''
+        Return the number of images available. 
+        '''
+        return self.length
+
+    def _normalize_key(self, key:int) -> int:
+        '''
+        Return
+        ------
+        key : int
+            non-negative index of a single image
+
+        Raises
+        ------
+        TypeError
+            If key is not int
+        IndexError
+            If key is out of bound
+        '''
+        length = len(self)
+        if not isinstance(key, int):
+            raise TypeError(f'{self.__class__} indices must be integer, not {type(key)}')
+        if key < -length or key >= length:
+            raise IndexError(f'{self.__class__} index out of range')
+        return (key + length) % length
+
+    def __iter__(self):
+        '''
+        Iterate over images while a background thread reads up to `prefetch` images ahead.
+        '''
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending = deque()
+            for i in range(len(self)):
+                pending.append(executor.submit(self.__getitem__, i))
+                if len(pending) > self.prefetch:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    @property
+    def dtype(self) -> np.dtype:
+        # FILL THIS AREA: data type of a single image returned by __getitem__
+        raise NotImplementedError('dtype should be implemented')
+
+    def _frame_indices(self, key):
+        '''
+        Return
+        ------
+        indices: range or list[int] or None
+            non-negative indices selected by a slice, a list/1-D array of int, or a bool mask.
+            None if key selects a single image.
+
+        Raises
+        ------
+        TypeError
+            If key is a tuple, or a sequence that is not 1-D int or bool
+        IndexError
+            If key is out of bound, or a bool mask does not match the number of images
+        '''
+        length = len(self)
+        if isinstance(key, slice):
+            return range(*key.indices(length))
+        if isinstance(key, tuple):
+            raise TypeError(f'{self.__class__} supports indexing images only; index the returned array for the other axes')
+        if isinstance(key, (list, range, np.ndarray)):
+            key = np.asarray(key)
+            if key.size == 0:
+                return []
+            if key.ndim != 1 or not (key.dtype == bool or np.issubdtype(key.dtype, np.integer)):
+                raise TypeError(f'{self.__class__} indices must be a 1-D sequence of int or bool, not {key.dtype} with {key.ndim} dimension(s)')
+            if key.dtype == bool:
+                if len(key) != length:
+                    raise IndexError(f'{self.__class__} boolean index has length {len(key)}, expected {length}')
+                key = np.flatnonzero(key)
+            indices = [int(k) for k in key]
+            if any(k < -length or k >= length for k in indices):
+                raise IndexError(f'{self.__class__} index out of range')
+            return [(k + length) % length for k in indices]
+        return None
+
+    def _stack_frames(self, indices, array_type = 'numpy'):
+        '''
+        Return images at indices stacked along the first axis.
+        The numpy output is allocated once and filled image by image.
+        '''
+        if array_type == 'numpy':
+            data = np.empty((len(indices), *self.data_shape), dtype=self.dtype)
+            for i, key in enumerate(indices):
+                data[i] = self.__getitem__(key)
+        elif array_type == 'dask':
+            if len(indices) == 0:
+                return da.empty((0, *self.data_shape), dtype=self.dtype)
+            data = da.stack([self.__getitem__(key, array_type='dask') for key in indices])
+        else:
+            raise TypeError('array_type must be either "numpy" or "dask"')
+        return data
+
+    def close(self):
+        '''
+        Release resources held by the backend. Nothing to release by default.
+        '''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+class TCFileAbstract(TCFileSequenceMixin):
     '''
     interface class to TCF files.
     This class returns data as if list containg multiple data.
@@ -39,13 +208,20 @@ class TCFileAbstract(Sequence):
     format_version : str
     length : int
         time series length of the TCF file
-    data_shape : numpy.array[int]
+    data_shape : tuple[int]
         shape of single shot data
-    data_resolution : numpy.array[float]
+    data_resolution : tuple[float]
         (unit: μm) resolution of data. It represents unit resolution per pixel
+    dtype : numpy.dtype
+        data type of single shot data
     dt : float
         (unit: s) Time steps of data. Zero if it is single shot data
     tcfname : str
+
+    * Note: The file is kept open (read-only) while the instance is alive.
+      Call `close()` or use the instance as a context manager to release it.
+      Until then, the same file cannot be reopened for writing in this process
+      (h5py reports "file is already open for read-only").
     '''
     imgtype = None
     data_ndim = None
@@ -66,34 +242,57 @@ class TCFileAbstract(Sequence):
         assert isinstance(self.data_ndim, int), 'data_ndim should be specified by maintainer. Contact authors'
 
         self.tcfname = tcfname
-        with h5py.File(tcfname) as tcf_io:
-            assert 'Data' in tcf_io, 'The given file is not TCF file'
-            assert self.imgtype in tcf_io['Data'], 'The current imgtype is not supported in this file'
-            # load attributes
-            self.format_version = self.get_attr(tcf_io, '/', 'FormatVersion')
-            if not isinstance(self.format_version, str):
-                self.format_version = self.format_version.decode('UTF-8')
-
-            data_info_path = f'/Data/{self.imgtype}'
-            get_data_info_attr = lambda attr_name: self.get_attr(tcf_io, data_info_path, attr_name, default = 0)
-
-            self.data_shape = list(get_data_info_attr(f'Size{axis}') for axis in  ('Z', 'Y', 'X')[3-self.data_ndim:])
-            self.data_resolution = list(get_data_info_attr(f'Resolution{axis}') for axis in  ('Z', 'Y', 'X')[3-self.data_ndim:])
-            self.length = get_data_info_attr('DataCount')
-            self.dt = 0 if self.length == 1 else get_data_info_attr('DataCount')
-
-    def copy(self, output_file_path, compression_opt = {}):
+        self._h5 = h5py.File(tcfname, 'r', rdcc_nbytes=_RDCC_NBYTES, rdcc_nslots=_RDCC_NSLOTS)
+        tcf_io = self._h5
+        assert 'Data' in tcf_io, 'The given file is not TCF file'
+        assert self.imgtype in tcf_io['Data'], 'The current imgtype is not supported in this file'
+        # load attributes
+        self.format_version = self.get_attr(tcf_io, '/', 'FormatVersion')
+        if not isinstance(self.format_version, str):
+            self.format_version = self.format_version.decode('UTF-8')
+        # compare versions numerically once, instead of comparing strings per read ('1.10' < '1.3' as str)
+        self._fmt_lt_1_3 = _parse_version(self.format_version) < (1, 3)
+
+        data_info_path = f'/Data/{self.imgtype}'
+        # read every attribute once instead of issuing one HDF5 attribute read per lookup
+        data_info_attrs = dict(tcf_io[data_info_path].attrs)
+        get_data_info_attr = lambda attr_name: _attr_value(data_info_attrs, attr_name, default = 0)
+
+        self._axis_names = ('Z', 'Y', 'X')[3-self.data_ndim:]
+        self.data_shape = tuple(int(get_data_info_attr(f'Size{axis}')) for axis in self._axis_names)
+        self.data_resolution = tuple(float(get_data_info_attr(f'Resolution{axis}')) for axis in self._axis_names)
+        self.length = int(get_data_info_attr('DataCount'))
+        self.dt = 0 if self.length == 1 else get_data_info_attr('DataCount')
+
+    def copy(self, output_file_path, compression_opt = {}, chunks = None):
         """
-        Copies the structure, data, and attributes of an HDF5 file to a new file, compressing all datasets using gzip.
+        Copies the structure, data, and attributes of an HDF5 file to a new file, optionally recompressing datasets.
 
         Parameters:
         - input_file_path: path to the input HDF5 file.
         - output_file_path: path where the output HDF5 file will be created.
-        - compression_opt: Type of compression to use. default is uncompress data.
+        - compression_opt: Type of compression to use. default ({}) copies datasets as they are stored,
+            keeping the chunking and filters of the source (HDF5 copies the raw chunks, no decompression).
+            "blosc_lz4" (recommended) or "bitshuffle" select fast LZ4-based filters from hdf5plugin;
+            they read/write several times faster than gzip at a comparable ratio.
             If you want to compress data using gzip type `{"compression":"gzip", "compression_opts":}`.
+            Scalar datasets do not support filters and are copied uncompressed.
+        - chunks: None keeps the chunking of the source (or lets h5py choose one when compressing).
+            "auto" rechunks 3D datasets into ~1 MB slabs of full (Y, X) planes along Z,
+            which matches how a single frame is read.
         
         Note: This function does not return anything.
         """
+        if isinstance(compression_opt, str):
+            if compression_opt == 'blosc_lz4':
+                compression_opt = hdf5plugin.Blosc(cname='lz4', clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE)
+            elif compression_opt == 'bitshuffle':
+                compression_opt = hdf5plugin.Bitshuffle(cname='lz4')
+            else:
+                raise ValueError('Unsupported compression_opt: Supported presets are "blosc_lz4" and "bitshuffle"')
+        if chunks not in (None, 'auto'):
+            raise ValueError('Unsupported chunks: Supported values are None and "auto"')
+
         def copy_attributes(source, destination):
             """
             Copies attributes from the source to the destination.
@@ -111,37 +310,72 @@ class TCFileAbstract(Sequence):
                 item_in = group_in[key]
                 if isinstance(item_in, h5py.Dataset):
                     # Copy dataset with compression and its attributes
-                    data = item_in[...]
-                    dataset_out = group_out.create_dataset(key, data=data, **compression_opt)
+                    if not item_in.shape:
+                        # scalar or empty dataset: HDF5 does not allow chunk/filter options on them
+                        dataset_out = group_out.create_dataset(key, data=item_in[()])
+                    else:
+                        # chunk by chunk, so the whole dataset is never held in memory
+                        dataset_opt = dict(compression_opt)
+                        if chunks == 'auto' and item_in.ndim == 3 and all(item_in.shape):
+                            dataset_opt['chunks'] = _auto_chunk(item_in.shape, item_in.dtype)
+                        dataset_out = group_out.create_dataset(key, shape=item_in.shape, dtype=item_in.dtype, **dataset_opt)
+                        if dataset_out.chunks is None:
+                            dataset_out[...] = item_in[...]
+                        else:
+                            for chunk in dataset_out.iter_chunks():
+                                dataset_out[chunk] = item_in[chunk]
                     copy_attributes(item_in, dataset_out)  # Copy attributes for the dataset
                 elif isinstance(item_in, h5py.Group):
                     # Create group in the output file, copy attributes, and recurse
                     group_out_sub = group_out.create_group(key)
                     recursively_copy_and_compress(item_in, group_out_sub)
 
-        with h5py.File(self.tcfname, 'r') as file_in:
-            with h5py.File(output_file_path, 'w') as file_out:
-                recursively_copy_and_compress(file_in, file_out)
+        with h5py.File(output_file_path, 'w') as file_out:
+            if compression_opt or chunks is not None:
+                recursively_copy_and_compress(self._h5, file_out)
+            else:
+                # native HDF5 copy: raw chunks are copied without decoding
+                copy_attributes(self._h5, file_out)
+                for key in self._h5:
+                    self._h5.copy(self._h5[key], file_out, name=key)
 
-    def __len__(self):
+    def close(self):
         '''
-        Return the number of images available. 
+        Close the underlying HDF5 file. The instance cannot read data afterwards.
         '''
-        return self.length
+        h5 = getattr(self, '_h5', None)
+        if h5 is not None and h5.id.valid:
+            h5.close()
+
+    def __del__(self):
+        self.close()
+
+    def __getstate__(self):
+        # HDF5 handles cannot be pickled (e.g. dask-distributed workers); reopen it when unpickled
+        state = self.__dict__.copy()
+        if '_h5' in state:
+            state['_h5'] = None
+        return state
 
-    def __getitem__(self, key:int) -> np.ndarray:
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if '_h5' in state:
+            self._h5 = h5py.File(self.tcfname, 'r', rdcc_nbytes=_RDCC_NBYTES, rdcc_nslots=_RDCC_NSLOTS)
+
+    def __getitem__(self, key:IndexKey) -> np.ndarray:
         '''
         Return
         ------
         data : numpy.ndarray[uint8]
-            return a single image.
+            return a single image if key is int.
+            If key is a slice, a list/1-D array of int, or a bool mask, return images stacked along the first axis.
 
         Raises
         ------
         TypeError
-            If key is not int
+            If key is none of the above (tuples are rejected: only the image axis can be indexed)
         IndexError
-            If key is out of bound
+            If key is out of bound, or a bool mask does not match the number of images
         '''
         data_path = self.get_data_location(key)
         # FILL THIS AREA: find raw data in data_path and process them into a desired format
@@ -155,86 +389,176 @@ class TCFileAbstract(Sequence):
             return the path of data corresponding to key
             It checks whether the key is defined corretly
         '''
-        length = len(self)
-        if not isinstance(key, int):
-            raise TypeError(f'{self.__class__} indices must be integer, not {type(key)}')
-        if key < -length or key >= length:
-            raise IndexError(f'{self.__class__} index out of range')
-        key = (key + length) % length
+        key = self._normalize_key(key)
         data_path = f'/Data/{self.imgtype}/{key:06d}'
         return data_path
 
-    def asdask(self) -> np.ndarray:
-        dask_arrays = [self.__getitem__(i, array_type='dask') for i in range(len(self))]
+    def raw(self, key:int) -> h5py.Dataset:
+        '''
+        Return
+        ------
+        data : h5py.Dataset
+            stored data of a single image, neither loaded nor converted (e.g. uint16 RI*1e4).
+            It supports numpy indexing and reads only the indexed part,
+            e.g. `tcfile.raw(0)[10]` reads a single plane. Useful to browse data or check min/max.
+            * Note: Whole-array operations such as `np.zeros_like(tcfile.raw(0))` or
+              `np.asarray(tcfile.raw(0))` load the entire image.
+
+        Raises
+        ------
+        TypeError
+            If the image is stored in the deprecated tile format
+        '''
+        obj = self._h5[self.get_data_location(key)]
+        if not isinstance(obj, h5py.Dataset):
+            raise TypeError('raw data is not available for the deprecated tile format')
+        return obj
+
+    def asdask(self) -> da.Array:
+        '''
+        Return
+        ------
+        data : dask.array.Array
+            lazy array of all images stacked along the first axis.
+            Each image is one delayed numpy read, so the graph has a single node per image.
+        '''
+        if len(self) == 0:
+            return da.empty((0, *self.data_shape), dtype=self.dtype)
+        read = delayed(self.__getitem__)
+        dask_arrays = [da.from_delayed(read(i), shape=self.data_shape, dtype=self.dtype) for i in range(len(self))]
         rst = da.stack(dask_arrays)
         return rst
 
+    def _stitch_tiles(self, data_path:str, data_type, array_type = 'numpy'):
+        '''
+        Assemble data stored in the deprecated tile format (TILE_nnn datasets under data_path).
+
+        Return
+        ------
+        data : numpy.ndarray or dask.array.Array
+            For "numpy", HDF5 writes each tile straight into the output.
+            For "dask", every tile becomes a single delayed read.
+        '''
+        tcf_io = self._h5
+        # numeric order, so TILE_10 comes after TILE_9 even without zero padding
+        tile_path_list = sorted((p for p in tcf_io[data_path] if _TILE_RE.match(p)), key=lambda p: int(p.removeprefix('TILE_')))
+        tiles = []
+        for p in tile_path_list:
+            tile = tcf_io[f'{data_path}/{p}']
+            tile_attrs = dict(tile.attrs)
+            get_tile_attr = lambda attr_name: _attr_value(tile_attrs, attr_name)
+            if get_tile_attr('SamplingStep') != 1:
+                # what?! I don't know why... ask Tomocube
+                continue
+            # For each axis, get the tile's placement info as python ints (not numpy scalars):
+            offset = tuple(int(get_tile_attr(f'DataIndexOffsetPoint{axis}')) for axis in self._axis_names)
+            last_idx = tuple(int(get_tile_attr(f'DataIndexLastPoint{axis}')) for axis in self._axis_names)
+            mapping_range = tuple(slice(start, end + 1) for start, end in zip(offset, last_idx))
+            valid_range = tuple(slice(0, end - start + 1) for start, end in zip(offset, last_idx))
+            tiles.append((tile, mapping_range, valid_range))
+
+        if array_type == 'numpy':
+            data = np.zeros(self.data_shape, dtype=data_type)
+            # tiles do not overlap, so HDF5 writes each one straight into its own slab of data
+            for tile, mapping_range, valid_range in tiles:
+                tile.read_direct(data, valid_range, mapping_range)
+        elif array_type == 'dask':
+            data = da.zeros(self.data_shape, dtype=data_type)
+            for tile, mapping_range, valid_range in tiles:
+                tile_shape = tuple(s.stop - s.start for s in valid_range)
+                data[mapping_range] = da.from_delayed(delayed(tile.__getitem__)(valid_range), shape=tile_shape, dtype=tile.dtype)
+        else:
+            raise TypeError('array_type must be either "numpy" or "dask"')
+        return data
+
     @staticmethod
     def get_attr(tcf_io, path, attr_name, default = None):
-        attr_value = tcf_io[path].attrs.get(attr_name, default = [default])[0]
-        return attr_value
+        return _attr_value(tcf_io[path].attrs, attr_name, default)
 
 class TCFileRIAbstract(TCFileAbstract):
-    def __getitem__(self, key: int, array_type = 'numpy') -> np.ndarray:
+    def __init__(self, tcfname:str):
+        super().__init__(tcfname)
+        # frames of the deprecated tile format are groups of TILE_nnn datasets; probe the layout once
+        self._has_tiles = self.length > 0 and isinstance(self._h5[self.get_data_location(0)], h5py.Group)
+
+    @property
+    def dtype(self) -> np.dtype:
+        if self._fmt_lt_1_3 and len(self) > 0:
+            # RI is stored as it is
+            return self._h5[self.get_data_location(0)].dtype
+        return np.dtype(np.float32)
+
+    def __getitem__(self, key: IndexKey, array_type = 'numpy') -> np.ndarray:
+        indices = self._frame_indices(key)
+        if indices is not None:
+            return self._stack_frames(indices, array_type)
         if array_type == 'numpy':
             into_array = np.asarray
-            zeros = np.zeros
         elif array_type == 'dask':
             into_array = da.from_array
-            zeros = da.zeros
         else:
             raise TypeError('array_type must be either "numpy" or "dask"')
 
         data_path = self.get_data_location(key)
-        if self.format_version < '1.3':
+        if self._fmt_lt_1_3:
             # RI = data
-            data = into_array(h5py.File(self.tcfname)[data_path])
+            data = into_array(self._h5[data_path])
+        elif not self._has_tiles:
+            # RI = data/1e4
+            dset = self._h5[data_path]
+            if array_type == 'numpy':
+                # HDF5 converts to float32 while reading; no intermediate uint16 copy
+                data = np.empty(dset.shape, dtype=np.float32)
+                dset.read_direct(data)
+                data /= 1e4
+            else:
+                # cast and scale in a single pass
+                data = np.divide(into_array(dset), np.float32(1e4), dtype=np.float32)
         else:
-            try:
-                # RI = data/1e4
-                data = into_array(h5py.File(self.tcfname)[data_path])
-                data = data.astype(np.float32)
+            warnings.warn(("You use an experimental file format deprecated.\n"
+                           "Update your reconstruction program and rebuild TCF file."))
+            data_attrs = dict(self._h5[data_path].attrs)
+            get_data_attr = lambda attr_name: _attr_value(data_attrs, attr_name)
+            # RI = data/1e3 + min_RI for uint8 data type (ScalarType True)
+            # RI = data/1e4          for uint16 data type (ScalarType False)
+            is_uint8 = get_data_attr('ScalarType')
+            # tiles (uint8 or uint16) are converted to float32 by HDF5 while they are stitched,
+            # so the scaling below works in place on the only full-size buffer
+            data = self._stitch_tiles(data_path, np.float32, array_type)
+            if is_uint8:
+                min_RI = get_data_attr('RIMin')
+                data /= 1e3
+                data += min_RI
+            else:
                 data /= 1e4
-            except:
-                warnings.warn(("You use an experimental file format deprecated.\n"
-                               "Update your reconstruction program and rebuild TCF file."))
-                if into_array == 'dask':
-                    raise ValueError('"dask" does not support this TCFile')
-                with h5py.File(self.tcfname) as tcf_io:
-                    get_data_attr = lambda attr_name: self.get_attr(tcf_io, data_path, attr_name)
-                    # RI = data/1e3 + min_RI for uint8 data type (ScalarType True)
-                    # RI = data/1e4          for uint16 data type (ScalarType False)
-                    is_uint8 = get_data_attr('ScalarType')
-                    if is_uint8:
-                        data_type = 'u1'
-                    else:
-                        data_type = 'u2'
-                    data = zeros(self.data_shape, dtype=data_type)
-                    tile_path_list = [ p for p in tcf_io[data_path].keys() if re.match(r'^TILE_\d+$', p)]
-                    tile_path_list.sort()
-                    for p in tile_path_list:
-                        tile_path = f'{data_path}/{p}'
-                        get_tile_attr = lambda attr_name: self.get_attr(tcf_io, tile_path, attr_name)
-                        sampling_step = get_tile_attr('SamplingStep')
-                        if sampling_step != 1:
-                            # what?! I don't know why... ask Tomocube
-                            continue
-
-                        offset = list(get_tile_attr(f'DataIndexOffsetPoint{axis}') for axis in ('Z', 'Y', 'X')[3-self.data_ndim:])
-                        last_idx = list(get_tile_attr(f'DataIndexLastPoint{axis}') for axis in ('Z', 'Y', 'X')[3-self.data_ndim:])
-                        mapping_range = tuple(slice(start,end + 1) for start, end in zip(offset, last_idx))
-                        valid_data_range = tuple(slice(0,end - start + 1) for start, end in zip(offset, last_idx))
-                        data[mapping_range] += into_array(h5py.File(self.tcfname)[tile_path])[valid_data_range]
-                    data = data.astype(np.float32)
-                    if is_uint8:
-                        min_RI = get_data_attr('RIMin')
-                        data /= 1e3
-                        data += min_RI
-                    else:
-                        data /= 1e4
 
         return data
 
+    def to_zarr(self, output_path:str):
+        '''
+        Convert RI data into a zarr group, readable by TCFileRI3DZarr or TCFileRI2DMIPZarr.
+        Unlike h5py, zarr does not hold the GIL while decoding chunks,
+        so the converted data can be loaded in parallel by dask (or dask-distributed).
+
+        The group holds a single float32 array named after imgtype with shape (T, *data_shape),
+        and the TCF metadata (format_version, data_resolution, dt) as group attributes.
+
+        Parameters
+        ----------
+        output_path : str
+            location of the zarr group to create. Existing data is overwritten.
+        '''
+        root = zarr.open_group(output_path, mode='w')
+        root.attrs.update({
+            'format_version': self.format_version,
+            'data_resolution': list(self.data_resolution),
+            'dt': float(self.dt),
+        })
+        chunks = (1, *_auto_chunk(self.data_shape, np.float32))
+        arr = root.create_array(self.imgtype, shape=(len(self), *self.data_shape), dtype=np.float32, chunks=chunks)
+        for i in range(len(self)):
+            arr[i] = self[i]
+
 class TCFileRI3D(TCFileRIAbstract):
     imgtype = '3D'
     data_ndim = 3
@@ -243,13 +567,85 @@ class TCFileRI2DMIP(TCFileRIAbstract):
     imgtype = '2DMIP'
     data_ndim = 2
 
+class TCFileRIZarrAbstract(TCFileSequenceMixin):
+    '''
+    interface class to RI data converted by `TCFileRIAbstract.to_zarr`.
+    It has the same attributes as TCFileRIAbstract; tcfname is the location of the zarr group.
+    '''
+    imgtype = None
+    data_ndim = None
+
+    def __init__(self, zarrname:str):
+        '''
+        Paramters
+        ---------
+        zarrname : str
+            location of the zarr group written by `to_zarr`
+        '''
+        assert isinstance(self.imgtype, str), 'imgtype should be specified by maintainer. Contact authors'
+        assert isinstance(self.data_ndim, int), 'data_ndim should be specified by maintainer. Contact authors'
+
+        self.tcfname = zarrname
+        root = zarr.open_group(zarrname, mode='r')
+        assert self.imgtype in root, 'The current imgtype is not supported in this file'
+        self._zarr = root[self.imgtype]
+        self.format_version = root.attrs['format_version']
+        self.data_shape = tuple(self._zarr.shape[1:])
+        self.data_resolution = tuple(root.attrs['data_resolution'])
+        self.length = self._zarr.shape[0]
+        self.dt = root.attrs['dt']
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._zarr.dtype
+
+    def __getitem__(self, key: IndexKey, array_type = 'numpy') -> np.ndarray:
+        indices = self._frame_indices(key)
+        if indices is None:
+            selection = self._normalize_key(key)
+        elif isinstance(indices, range) and indices.step > 0:
+            # a single zarr read over the whole slice
+            selection = slice(indices.start, indices.stop, indices.step)
+        else:
+            selection = np.asarray(indices, dtype=np.intp)
+
+        if array_type == 'numpy':
+            return self._zarr.oindex[selection]
+        elif array_type == 'dask':
+            return da.from_zarr(self._zarr)[selection]
+        else:
+            raise TypeError('array_type must be either "numpy" or "dask"')
+
+    def asdask(self) -> da.Array:
+        return da.from_zarr(self._zarr)
+
+class TCFileRI3DZarr(TCFileRIZarrAbstract):
+    imgtype = '3D'
+    data_ndim = 3
+
+class TCFileRI2DMIPZarr(TCFileRIZarrAbstract):
+    imgtype = '2DMIP'
+    data_ndim = 2
+
 class TCFileBF(TCFileAbstract):
     imgtype = 'BF'
     data_ndim = 2
-    def __getitem__(self, key: int) -> np.ndarray:
+
+    @property
+    def dtype(self) -> np.dtype:
+        # stored as uint8 RGB
+        return np.dtype(np.uint8)
+
+    def asdask(self):
+        raise TypeError('BF images are returned as PIL images; asdask() is not supported')
+
+    def __getitem__(self, key: IndexKey) -> np.ndarray:
+        indices = self._frame_indices(key)
+        if indices is not None:
+            # images are returned as a list of PIL images
+            return [self.__getitem__(i) for i in indices]
         data_path = self.get_data_location(key)
-        with h5py.File(self.tcfname) as f:
-            data = f[data_path][()]
+        data = self._h5[data_path][()]
         data = Image.fromarray(data, mode = 'RGB')
         return data
 
@@ -260,58 +656,50 @@ class TCFileFL3D(TCFileAbstract):
     def __init__(self, tcfname: str, channel: int = 0):
         self.channel = channel
         super().__init__(tcfname)
-        with h5py.File(self.tcfname) as f:
-            self.max_channels = self.get_attr(f, f'/Data/{self.imgtype}', 'Channels')
+        self.max_channels = self.get_attr(self._h5, f'/Data/{self.imgtype}', 'Channels')
 
     def get_data_location(self, key: int) -> str:
-        length = len(self)
-        if not isinstance(key, int):
-            raise TypeError(f'{self.__class__} indices must be integer, not {type(key)}')
-        if key < -length or key >= length:
-            raise IndexError(f'{self.__class__} index out of range')
-        key = (key + length) % length
+        key = self._normalize_key(key)
         # Build the path with the correct channel:
         return f'/Data/{self.imgtype}/CH{self.channel}/{key:06d}'
 
-    def __getitem__(self, key: int, array_type='numpy') -> np.ndarray:
+    @property
+    def dtype(self) -> np.dtype:
+        if len(self) == 0:
+            # no image to look at; fluorescence is stored as uint16
+            return np.dtype(np.uint16)
+        obj = self._h5[self.get_data_location(0)]
+        if isinstance(obj, h5py.Dataset):
+            return obj.dtype
+        is_uint8 = self.get_attr(self._h5, obj.name, 'ScalarType')
+        return np.dtype(np.uint8 if is_uint8 else np.uint16)
+
+    def __getitem__(self, key: IndexKey, array_type='numpy') -> np.ndarray:
+        indices = self._frame_indices(key)
+        if indices is not None:
+            return self._stack_frames(indices, array_type)
         if array_type == 'numpy':
             into_array = np.asarray
-            zeros = np.zeros
         elif array_type == 'dask':
             into_array = da.from_array
-            zeros = da.zeros
         else:
             raise TypeError('array_type must be either "numpy" or "dask"')
 
         data_path = self.get_data_location(key)
-        with h5py.File(self.tcfname, 'r') as f:
-            obj = f[data_path]
-            # If it's a dataset, do a direct read:
-            if isinstance(obj, h5py.Dataset):
-                data = into_array(obj)
-                return data
-            # Otherwise, if it's a group, do tile stitching:
-            elif isinstance(obj, h5py.Group):
-                # Prepare for stitching:
-                get_data_attr = lambda attr_name: self.get_attr(f, data_path, attr_name)
-                is_uint8 = get_data_attr('ScalarType')
-                # Use proper numpy dtypes:
-                data_type = np.uint8 if is_uint8 else np.uint16
-                data = zeros(self.data_shape, dtype=data_type)
-                tile_path_list = [p for p in obj.keys() if re.match(r'^TILE_\d+$', p)]
-                tile_path_list.sort()
-                for tile in tile_path_list:
-                    tile_path = f'{data_path}/{tile}'
-                    get_tile_attr = lambda attr_name: self.get_attr(f, tile_path, attr_name)
-                    if get_tile_attr('SamplingStep') != 1:
-                        continue  # skip unsupported tiles
-                    # For each axis, get the tile’s placement info:
-                    offset = [get_tile_attr(f'DataIndexOffsetPoint{axis}') for axis in ('Z', 'Y', 'X')[3-self.data_ndim:]]
-                    last_idx = [get_tile_attr(f'DataIndexLastPoint{axis}') for axis in ('Z', 'Y', 'X')[3-self.data_ndim:]]
-                    mapping_range = tuple(slice(o, l + 1) for o, l in zip(offset, last_idx))
-                    valid_range = tuple(slice(0, l - o + 1) for o, l in zip(offset, last_idx))
-                    tile_data = into_array(f[tile_path])[valid_range]
-                    data[mapping_range] += tile_data
-                return data
-            else:
-                raise TypeError("Unexpected HDF5 object type at data_path")
+        f = self._h5
+        obj = f[data_path]
+        # If it's a dataset, do a direct read:
+        if isinstance(obj, h5py.Dataset):
+            data = into_array(obj)
+            return data
+        # Otherwise, if it's a group, do tile stitching:
+        elif isinstance(obj, h5py.Group):
+            # Prepare for stitching:
+            get_data_attr = lambda attr_name: self.get_attr(f, data_path, attr_name)
+            is_uint8 = get_data_attr('ScalarType')
+            # Use proper numpy dtypes:
+            data_type = np.uint8 if is_uint8 else np.uint16
+            data = self._stitch_tiles(data_path, data_type, array_type)
+            return data
+        else:
+            raise TypeError("Unexpected HDF5 object type at data_path")
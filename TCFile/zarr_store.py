@@ -72,6 +72,7 @@ class TCFZarrStore(Store):
                     # Create first channel to get metadata
                     tcfile_fl = TCFileFL3D(self.tcf_path, channel=0)
                     max_channels = tcfile_fl.max_channels
+                    tcfile_fl.close()
 
                     # Initialize all channels
                     for ch in range(max_channels):
@@ -459,7 +460,8 @@ class TCFZarrStore(Store):
 
     def close(self):
         """Close all open file handles."""
-        # TCFile instances open/close HDF5 files per access, so no persistent handles to close
+        for tcfile in self._tcfiles.values():
+            tcfile.close()
         self._tcfiles.clear()
         self._metadata_cache.clear()
 
@@ -1,6 +1,44 @@
 from . import SAMPLE_TCF_FILE
 from TCFile import TCFile
+from TCFile.TCFile_class import TCFileRI3D, TCFileRI3DZarr, TCFileFL3D
 import numpy as np
+import pytest
+import h5py
+
+def write_tile_tcf(path, scalar_type = 0, format_version = '1.3'):
+    '''
+    Write a small TCF file in the deprecated tile format and return the expected RI.
+    Each frame has 11 tiles (TILE_0 ... TILE_10, not zero padded) along X and one skipped tile.
+    '''
+    data_shape = (4, 6, 22)
+    dtype = np.uint8 if scalar_type else np.uint16
+    rng = np.random.default_rng(0)
+    expected = []
+    with h5py.File(path, 'w') as f:
+        f.attrs['FormatVersion'] = np.array([format_version.encode()])
+        info = f.create_group('Data/3D')
+        for axis, size in zip(('Z', 'Y', 'X'), data_shape):
+            info.attrs[f'Size{axis}'] = np.array([size])
+            info.attrs[f'Resolution{axis}'] = np.array([0.1])
+        info.attrs['DataCount'] = np.array([2])
+        for i in range(2):
+            frame = info.create_group(f'{i:06d}')
+            frame.attrs['ScalarType'] = np.array([scalar_type])
+            frame.attrs['RIMin'] = np.array([1.33])
+            raw = np.zeros(data_shape, dtype=dtype)
+            for t in range(11):
+                # tiles are stored larger than their valid region
+                tile_data = rng.integers(1, 200, (4, 6, 3), dtype=dtype)
+                tile = frame.create_dataset(f'TILE_{t}', data=tile_data)
+                tile.attrs['SamplingStep'] = np.array([1])
+                for axis, offset, last in zip(('Z', 'Y', 'X'), (0, 0, 2*t), (3, 5, 2*t + 1)):
+                    tile.attrs[f'DataIndexOffsetPoint{axis}'] = np.array([offset])
+                    tile.attrs[f'DataIndexLastPoint{axis}'] = np.array([last])
+                raw[:, :, 2*t:2*t + 2] = tile_data[:, :, :2]
+            skipped = frame.create_dataset('TILE_11', data=np.full((4, 6, 22), 255, dtype=dtype))
+            skipped.attrs['SamplingStep'] = np.array([2])
+            expected.append(raw / 1e3 + 1.33 if scalar_type else raw / 1e4)
+    return np.stack(expected)
 
 class TestTCFile:
 
@@ -22,7 +60,156 @@ class TestTCFile:
         for data in tcfile:
             assert np.array_equal(tcfile.data_shape, data.shape)
             
+    def test_slice_read(self):
+        tcfile = TCFile(SAMPLE_TCF_FILE,'3D')
+        data = tcfile[1:3]
+        assert data.shape == (2, *tcfile.data_shape)
+        assert np.array_equal(data[0], tcfile[1])
+        assert np.array_equal(tcfile[[0, -1]][1], tcfile[-1])
+
+    def test_asdask(self):
+        tcfile = TCFile(SAMPLE_TCF_FILE,'3D')
+        data = tcfile.asdask()
+        assert data.shape == (len(tcfile), *tcfile.data_shape)
+        assert data.dtype == tcfile.dtype
+        assert np.array_equal(data[0].compute(), tcfile[0])
+
+    def test_raw(self):
+        tcfile = TCFile(SAMPLE_TCF_FILE,'3D')
+        raw = tcfile.raw(0)
+        assert raw.shape == tcfile.data_shape
+        assert raw[0].shape == tcfile.data_shape[1:]
+
     def test_attributes(self):
         tcfile = TCFile(SAMPLE_TCF_FILE,'3D')
         assert len(tcfile) == 10
         assert tcfile.dt >= 0
+
+    def test_close(self):
+        with TCFile(SAMPLE_TCF_FILE,'3D') as tcfile:
+            data = tcfile[0]
+        assert np.array_equal(tcfile.data_shape, data.shape)
+        assert not tcfile._h5.id.valid
+        with pytest.raises(KeyError):
+            tcfile[0]
+
+    def test_copy(self, tmp_path):
+        tcfile = TCFile(SAMPLE_TCF_FILE,'3D')
+        for name, compression_opt, chunks in (('raw.TCF', {}, None),
+                                              ('gzip.TCF', {'compression': 'gzip'}, None),
+                                              ('blosc.TCF', 'blosc_lz4', 'auto')):
+            output_path = str(tmp_path / name)
+            tcfile.copy(output_path, compression_opt, chunks)
+            with TCFile(output_path,'3D') as copied:
+                assert len(copied) == len(tcfile)
+                assert np.array_equal(copied[0], tcfile[0])
+
+    def test_to_zarr(self, tmp_path):
+        tcfile = TCFile(SAMPLE_TCF_FILE,'3D')
+        output_path = str(tmp_path / 'sample.zarr')
+        tcfile.to_zarr(output_path)
+        zarr_file = TCFileRI3DZarr(output_path)
+        assert len(zarr_file) == len(tcfile)
+        assert zarr_file.data_shape == tcfile.data_shape
+        assert np.array_equal(zarr_file[-1], tcfile[-1])
+        assert zarr_file.asdask().shape == (len(tcfile), *tcfile.data_shape)
+        assert not hasattr(zarr_file, 'raw') and not hasattr(zarr_file, 'copy')
+
+    @pytest.mark.parametrize('scalar_type', [1, 0])
+    def test_tile_format(self, tmp_path, scalar_type):
+        path = str(tmp_path / 'tile.TCF')
+        expected = write_tile_tcf(path, scalar_type)
+        with pytest.warns(UserWarning), TCFileRI3D(path) as tcfile:
+            data = tcfile[0]
+            assert data.dtype == np.float32
+            assert np.allclose(data, expected[0], atol=1e-6)
+            dask_data = tcfile.__getitem__(1, array_type='dask')
+            assert dask_data.dtype == np.float32
+            assert np.allclose(dask_data.compute(), expected[1], atol=1e-6)
+            assert np.allclose(tcfile.asdask().compute(), expected, atol=1e-6)
+
+    def test_copy_scalar_dataset(self, tmp_path):
+        path = str(tmp_path / 'tile.TCF')
+        write_tile_tcf(path)
+        with h5py.File(path, 'a') as f:
+            f['Info/Scalar'] = 3.5
+        for compression_opt in ({'compression': 'gzip'}, 'blosc_lz4'):
+            output_path = str(tmp_path / 'copied.TCF')
+            with pytest.warns(UserWarning), TCFileRI3D(path) as tcfile:
+                tcfile.copy(output_path, compression_opt)
+                with TCFileRI3D(output_path) as copied:
+                    assert np.array_equal(copied[0], tcfile[0])
+            with h5py.File(output_path, 'r') as f:
+                assert f['Info/Scalar'][()] == 3.5
+
+    def test_frame_keys(self, tmp_path):
+        path = str(tmp_path / 'tile.TCF')
+        expected = write_tile_tcf(path)
+        with pytest.warns(UserWarning), TCFileRI3D(path) as tcfile:
+            assert np.allclose(tcfile[::-1], expected[::-1], atol=1e-6)
+            assert np.allclose(tcfile[np.array([1, -2])], expected[[1, 0]], atol=1e-6)
+            assert np.allclose(tcfile[[False, True]], expected[1:], atol=1e-6)
+            assert tcfile[[]].shape == (0, *tcfile.data_shape)
+            with pytest.raises(TypeError):
+                tcfile[0, 1]
+            with pytest.raises(TypeError):
+                tcfile[[0.7]]
+            with pytest.raises(IndexError):
+                tcfile[[True]]
+            with pytest.raises(IndexError):
+                tcfile[[0, 2]]
+
+    def test_asdask_empty(self, tmp_path):
+        path = str(tmp_path / 'empty.TCF')
+        with h5py.File(path, 'w') as f:
+            f.attrs['FormatVersion'] = np.array([b'1.2'])
+            for imgtype in ('3D', '3DFL'):
+                info = f.create_group(f'Data/{imgtype}')
+                for axis in ('Z', 'Y', 'X'):
+                    info.attrs[f'Size{axis}'] = np.array([4])
+                info.attrs['DataCount'] = np.array([0])
+            f['Data/3DFL'].attrs['Channels'] = np.array([1])
+        for tcfile in (TCFileRI3D(path), TCFileFL3D(path)):
+            with tcfile:
+                assert tcfile.asdask().shape == (0, 4, 4, 4)
+
+    @pytest.mark.parametrize('format_version', ['1.10', '1.4b'])
+    def test_format_version(self, tmp_path, format_version):
+        path = str(tmp_path / 'tile.TCF')
+        expected = write_tile_tcf(path, format_version=format_version)
+        with pytest.warns(UserWarning), TCFileRI3D(path) as tcfile:
+            assert tcfile.format_version == format_version
+            assert np.allclose(tcfile[0], expected[0], atol=1e-6)
+
+    def test_tile_probe(self, tmp_path, monkeypatch):
+        calls = []
+        stitch_tiles = TCFileRI3D._stitch_tiles
+        def counting_stitch_tiles(self, *args, **kwargs):
+            calls.append(args[0])
+            return stitch_tiles(self, *args, **kwargs)
+        monkeypatch.setattr(TCFileRI3D, '_stitch_tiles', counting_stitch_tiles)
+
+        tile_path = str(tmp_path / 'tile.TCF')
+        write_tile_tcf(tile_path)
+        with pytest.warns(UserWarning), TCFileRI3D(tile_path) as tcfile:
+            assert tcfile._has_tiles
+            tcfile[1]
+        assert calls == ['/Data/3D/000001']
+
+        plain_path = str(tmp_path / 'plain.TCF')
+        with h5py.File(plain_path, 'w') as f:
+            f.attrs['FormatVersion'] = np.array([b'1.4'])
+            for imgtype, data_path in (('3D', 'Data/3D/000000'), ('3DFL', 'Data/3DFL/CH0/000000')):
+                f[data_path] = np.full((4, 4, 4), 13370, dtype=np.uint16)
+                info = f[f'Data/{imgtype}']
+                for axis in ('Z', 'Y', 'X'):
+                    info.attrs[f'Size{axis}'] = np.array([4])
+                info.attrs['DataCount'] = np.array([1])
+            f['Data/3DFL'].attrs['Channels'] = np.array([1])
+        with TCFileRI3D(plain_path) as tcfile:
+            assert not tcfile._has_tiles
+            assert np.allclose(tcfile[0], 1.337)
+        assert len(calls) == 1
+        # the probe is RI-only: an FL channel without data can still be constructed
+        with TCFileFL3D(plain_path, channel=5) as tcfile:
+            assert len(tcfile) == 1